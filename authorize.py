@@ -36,7 +36,11 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import json
+import logging
+import re
 import secrets
 import sys
 import time
@@ -44,17 +48,31 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is optional; it is several times faster than stdlib json for request/response bodies.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 # eth-account imports can differ slightly by version; we try both encode helpers.
 from eth_account import Account
+from eth_account.messages import SignableMessage
 try:
     from eth_account.messages import encode_typed_data  # newer
-except Exception:  # pragma: no cover
+except ImportError:  # pragma: no cover
     encode_typed_data = None
 try:
     from eth_account.messages import encode_structured_data  # older
-except Exception:  # pragma: no cover
+except ImportError:  # pragma: no cover
     encode_structured_data = None
+# eth-account's own EIP-712 hashing helpers; with them the builder template can reuse a precomputed domain separator.
+try:
+    from eth_account._utils.encode_typed_data.encoding_and_hashing import hash_domain, hash_struct
+except ImportError:  # pragma: no cover
+    hash_domain = hash_struct = None
 
 
 @dataclass(frozen=True)
@@ -73,31 +91,105 @@ ENVS: Dict[str, EnvConfig] = {
 }
 
 
+logger = logging.getLogger(__name__)
+
+
+# EIP-712 templates shared by every authorize signature (eth-account does not mutate them).
+_EIP712_BUILDER_TYPES: Dict[str, Any] = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+    ],
+    "AddAccountSignerWithBuilder": [
+        {"name": "accountID", "type": "address"},
+        {"name": "signer", "type": "address"},
+        {"name": "permissions", "type": "string"},
+        {"name": "builderAccountID", "type": "address"},
+        {"name": "maxFutureFeeRate", "type": "uint32"},
+        {"name": "maxSpotFeeRate", "type": "uint32"},
+        {"name": "nonce", "type": "uint32"},
+        {"name": "expiration", "type": "int64"},
+    ],
+}
+_DOMAIN_TEMPLATE_BY_CHAIN: Dict[int, Dict[str, Any]] = {
+    cid: {"name": "GRVT Exchange", "version": "0", "chainId": cid} for cid in (325, 326, 327)
+}
+
+# The template domains never change, so hash their separators once at import.
+_DOMAIN_SEP: Dict[int, bytes] = (
+    {cid: hash_domain(d) for cid, d in _DOMAIN_TEMPLATE_BY_CHAIN.items()} if hash_domain is not None else {}
+)
+
+
+# One pooled session for every call so the authorize -> login -> get_sub_accounts
+# sequence reuses keep-alive connections instead of a fresh TCP/TLS handshake each time.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ),
+)
+_SESSION.headers.update({"Connection": "keep-alive", "User-Agent": "grvt-builder-examples/authorize"})
+atexit.register(_SESSION.close)
+
+
+_GRAVITY_RE = re.compile(r"(?:^|[;,\s])(gravity=[^;]*)", re.IGNORECASE)
+
+
 def _ensure_0x(s: str) -> str:
     s = s.strip()
     s = s if s.startswith("0x") else "0x" + s
     return s.lower()
 
 
+@functools.lru_cache(maxsize=8)
+def _account_for(pk_hex: str) -> Any:
+    # Key derivation is an EC multiplication; pass keys through _ensure_0x so equal keys share an entry.
+    return Account.from_key(pk_hex)
+
+
 def _hex32(n: int) -> str:
-    return "0x" + n.to_bytes(32, "big").hex()
+    return f"0x{n:064x}"
 
 
 def _parse_gravity_cookie(set_cookie_header: Optional[str]) -> Optional[str]:
     # Docs show extracting gravity=[^;]* from Set-Cookie. :contentReference[oaicite:5]{index=5}
     if not set_cookie_header:
         return None
-    # Sometimes multiple cookies; requests exposes combined headers awkwardly.
-    # We'll just look for 'gravity=' in the string.
-    idx = set_cookie_header.lower().find("gravity=")
-    if idx == -1:
-        return None
-    frag = set_cookie_header[idx:]
-    end = frag.find(";")
-    return frag if end == -1 else frag[:end]
+    # Sometimes multiple cookies; requests exposes combined headers awkwardly,
+    # so match 'gravity=' at a cookie boundary anywhere in the string.
+    m = _GRAVITY_RE.search(set_cookie_header)
+    return m.group(1) if m else None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
 
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
-def _print_http(title: str, resp: requests.Response) -> None:
+
+def _json_pretty(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _http_post(url: str, payload: Any, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    # Serialize once to bytes ourselves instead of letting requests run stdlib json.
+    headers = {**(headers or {}), "Content-Type": "application/json"}
+    return _SESSION.post(url, data=_json_dumps(payload), headers=headers, timeout=30)
+
+
+def _print_http(title: str, resp: requests.Response, parsed: Any = None) -> None:
+    # Pass the already-parsed JSON body as `parsed` so it is not decoded twice; otherwise the raw text is shown.
     print(f"\n== {title} ==")
     print(f"URL: {resp.request.method} {resp.request.url}")
     print(f"Status: {resp.status_code}")
@@ -107,11 +199,10 @@ def _print_http(title: str, resp: requests.Response) -> None:
         print(f"X-Grvt-Account-Id (response): {resp.headers.get('x-grvt-account-id')}")
     if resp.headers.get("set-cookie"):
         print(f"Set-Cookie: {resp.headers.get('set-cookie')}")
-    try:
-        data = resp.json()
+    if parsed is not None:
         print("JSON:")
-        print(json.dumps(data, indent=2))
-    except Exception:
+        print(_json_pretty(parsed))
+    else:
         body = resp.text
         print("Body:")
         print(body[:2000] + ("..." if len(body) > 2000 else ""))
@@ -129,8 +220,11 @@ def build_eip712_payload(
     domain_chain_id: int,
 ) -> Dict[str, Any]:
     # Matches the structure shown in the Builder Integration docs. :contentReference[oaicite:6]{index=6}
+    domain = _DOMAIN_TEMPLATE_BY_CHAIN.get(domain_chain_id)
+    if domain is None:
+        domain = {"name": "GRVT Exchange", "version": "0", "chainId": domain_chain_id}
     return {
-        "domain": {"chainId": domain_chain_id, "name": "GRVT Exchange", "version": "0"},
+        "domain": domain,
         "message": {
             "accountID": main_account_id,
             "signer": signer_address,
@@ -142,37 +236,33 @@ def build_eip712_payload(
             "expiration": expiration_unix_ns,
         },
         "primaryType": "AddAccountSignerWithBuilder",
-        "types": {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-            ],
-            "AddAccountSignerWithBuilder": [
-                {"name": "accountID", "type": "address"},
-                {"name": "signer", "type": "address"},
-                {"name": "permissions", "type": "string"},
-                {"name": "builderAccountID", "type": "address"},
-                {"name": "maxFutureFeeRate", "type": "uint32"},
-                {"name": "maxSpotFeeRate", "type": "uint32"},
-                {"name": "nonce", "type": "uint32"},
-                {"name": "expiration", "type": "int64"},
-            ],
-        },
+        "types": _EIP712_BUILDER_TYPES,
     }
 
 
 def sign_eip712(user_privkey: str, typed_data: Dict[str, Any]) -> Tuple[int, str, str]:
-    if encode_typed_data is None and encode_structured_data is None:
-        raise RuntimeError("eth-account is missing encode_typed_data/encode_structured_data; try upgrading eth-account.")
-
     user_privkey = _ensure_0x(user_privkey)
-    acct = Account.from_key(user_privkey)
-
-    if encode_typed_data is not None:
+    acct = _account_for(user_privkey)
+
+    # Only a domain identical to a template may reuse its precomputed separator; anything else,
+    # including a different EIP712Domain type, is encoded in full by eth-account.
+    domain = typed_data["domain"]
+    types = typed_data["types"]
+    template = _DOMAIN_TEMPLATE_BY_CHAIN.get(domain.get("chainId"))
+    if (
+        hash_struct is not None
+        and template is not None
+        and domain == template
+        and types.get("EIP712Domain") == _EIP712_BUILDER_TYPES["EIP712Domain"]
+    ):
+        struct_hash = hash_struct(typed_data["primaryType"], types, typed_data["message"])
+        msg = SignableMessage(version=b"\x01", header=_DOMAIN_SEP[domain["chainId"]], body=struct_hash)
+    elif encode_typed_data is not None:
         msg = encode_typed_data(full_message=typed_data)
-    else:
+    elif encode_structured_data is not None:
         msg = encode_structured_data(primitive=typed_data)
+    else:
+        raise RuntimeError("eth-account is missing encode_typed_data/encode_structured_data; try upgrading eth-account.")
 
     signed = acct.sign_message(msg)
     v = int(signed.v)
@@ -198,9 +288,13 @@ def authorize_builder(
     Returns: api_key
     """
 
+    # Normalize every address/key once up front and use these locals throughout.
+    main_id = _ensure_0x(main_account_id)
+    builder_id = _ensure_0x(builder_account_id)
+    user_pk = _ensure_0x(user_privkey)
+
     # Builder API signer is an ETH keypair you generate for the user; its PUBLIC address goes into payload/request. :contentReference[oaicite:8]{index=8}
-    builder_api_key_signer_privkey = _ensure_0x(builder_api_key_signer_privkey)
-    signer_addr = Account.from_key(builder_api_key_signer_privkey).address
+    signer = _ensure_0x(_account_for(_ensure_0x(builder_api_key_signer_privkey)).address)
 
     # Docs show maxFutureFeeRate/maxSpotFeeRate are uint32 in the signing payload. :contentReference[oaicite:9]{index=9}
     # The request params are "string"; examples show decimals. :contentReference[oaicite:10]{index=10}
@@ -212,12 +306,12 @@ def authorize_builder(
     ms_uint32 = int(float(max_spot_fee_rate) * 10_000)
 
     nonce = secrets.randbelow(2**32)
-    expiration_ns = int((time.time() + 7 * 24 * 3600) * 1e9)  # 7 days from now; docs allow up to 30 days. :contentReference[oaicite:11]{index=11}
+    expiration_ns = time.time_ns() + 7 * 24 * 3600 * 1_000_000_000  # 7 days from now; docs allow up to 30 days. :contentReference[oaicite:11]{index=11}
 
     typed = build_eip712_payload(
-        main_account_id=_ensure_0x(main_account_id),
-        builder_account_id=_ensure_0x(builder_account_id),
-        signer_address=_ensure_0x(signer_addr),
+        main_account_id=main_id,
+        builder_account_id=builder_id,
+        signer_address=signer,
         permissions=permissions,
         max_future_fee_rate_uint32=mf_uint32,
         max_spot_fee_rate_uint32=ms_uint32,
@@ -225,19 +319,19 @@ def authorize_builder(
         expiration_unix_ns=expiration_ns,
         domain_chain_id=env.chain_id,
     )
-    print(typed)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("EIP-712 typed data: %s", typed)
 
-    v, r, s = sign_eip712(user_privkey=_ensure_0x(user_privkey), typed_data=typed)
+    v, r, s = sign_eip712(user_privkey=user_pk, typed_data=typed)
 
     url = f"{env.edge_base}/auth/builder/authorize"
-    print(permissions)
     payload = {
-        "main_account_id": _ensure_0x(main_account_id),
-        "builder_account_id": _ensure_0x(builder_account_id),
+        "main_account_id": main_id,
+        "builder_account_id": builder_id,
         "max_futures_fee_rate": max_futures_fee_rate,
         "max_spot_fee_rate": max_spot_fee_rate,
         "signature": {
-            "signer": _ensure_0x(main_account_id),
+            "signer": main_id,
             "r": r,
             "s": s,
             "v": v,
@@ -246,15 +340,19 @@ def authorize_builder(
             "chain_id": str(env.chain_id),
         },
         "builder_api_key_label": builder_api_key_label,
-        "builder_api_key_signer": _ensure_0x(signer_addr),
+        "builder_api_key_signer": signer,
         "builder_api_key_permissions": permissions,
     }
-    print(json.dumps(payload))
-
-    resp = requests.post(url, json=payload, timeout=30)
-    _print_http("Authorize Builder", resp)
-    resp.raise_for_status()
-    data = resp.json()
+    if logger.isEnabledFor(logging.DEBUG):
+        # Never log v/r/s; the signature is redacted.
+        logger.debug("Authorize payload: %s", _json_dumps({**payload, "signature": "<redacted>"}).decode())
+
+    resp = _http_post(url, payload)
+    if not resp.ok:
+        _print_http("Authorize Builder", resp)
+        resp.raise_for_status()
+    data = _json_loads(resp.content)
+    _print_http("Authorize Builder", resp, parsed=data)
     api_key = data.get("api_key")
     if not api_key:
         raise RuntimeError("authorize response missing api_key")
@@ -268,7 +366,7 @@ def login_with_api_key(env: EnvConfig, api_key: str) -> Tuple[str, str]:
     """
     url = f"{env.edge_base}/auth/api_key/login"
     headers = {"Content-Type": "application/json", "Cookie": "rm=true;"}  # per docs :contentReference[oaicite:13]{index=13}
-    resp = requests.post(url, headers=headers, json={"api_key": api_key}, timeout=30)
+    resp = _http_post(url, {"api_key": api_key}, headers)
     _print_http("API Key Login", resp)
     resp.raise_for_status()
 
@@ -292,10 +390,13 @@ def get_sub_accounts(env: EnvConfig, gravity_cookie: str, x_grvt_account_id: str
         "Cookie": gravity_cookie,
         "X-Grvt-Account-Id": x_grvt_account_id,
     }
-    resp = requests.post(url, headers=headers, json={}, timeout=30)
-    _print_http("Get Sub Accounts", resp)
-    resp.raise_for_status()
-    return resp.json()
+    resp = _http_post(url, {}, headers)
+    if not resp.ok:
+        _print_http("Get Sub Accounts", resp)
+        resp.raise_for_status()
+    data = _json_loads(resp.content)
+    _print_http("Get Sub Accounts", resp, parsed=data)
+    return data
 
 
 def main() -> int:
@@ -311,8 +412,13 @@ def main() -> int:
     p.add_argument("--builder-api-key-label", default="builder-smoke-test")
     p.add_argument("--max-futures-fee-rate", default="0.001")
     p.add_argument("--max-spot-fee-rate", default="0.0001")
+    p.add_argument("--debug", action="store_true", help="Log request payloads (signatures redacted).")
     args = p.parse_args()
 
+    logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+    if args.debug:
+        logger.setLevel(logging.DEBUG)
+
     env = ENVS[args.env]
     api_key = args.api_key
 
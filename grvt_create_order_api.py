@@ -21,17 +21,71 @@ Requirements:
 """
 
 import argparse
+import asyncio
+import atexit
+import functools
 import json
-import secrets
+import logging
+import os
+import re
 import sys
+import tempfile
+import threading
 import time
-from decimal import Decimal
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
 from enum import Enum
-from typing import Any, Dict, Optional, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from eth_abi import encode
 from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_account.messages import SignableMessage, encode_typed_data
+from eth_utils import is_address, keccak
+
+# orjson is optional; when present it replaces stdlib json for HTTP bodies,
+# order files and the instruments cache.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# coincurve is optional; it signs with libsecp256k1 instead of eth-keys.
+try:
+    from coincurve import PrivateKey as _CoincurvePrivateKey
+except ImportError:  # pragma: no cover
+    _CoincurvePrivateKey = None
+
+# fastjsonschema is optional; when present, order files are validated before signing.
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
+# eth-account's own EIP-712 hashing helpers; with them only the order struct is hashed per signature.
+try:
+    from eth_account._utils.encode_typed_data.encoding_and_hashing import hash_struct, hash_type
+except ImportError:  # pragma: no cover
+    hash_struct = hash_type = None
+
+# pycryptodome normally arrives with eth-account (via eth-keyfile); its keccak
+# skips eth_utils' argument dispatch. Fall back to eth_utils if it is absent.
+try:
+    from Crypto.Hash import keccak as _crypto_keccak
+except ImportError:  # pragma: no cover
+    _crypto_keccak = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    import aiohttp
+
+
+logger = logging.getLogger(__name__)
 
 
 # ================================================================================
@@ -102,8 +156,18 @@ TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE = {
     TimeInForce.FILL_OR_KILL: SignTimeInForce.FILL_OR_KILL,
 }
 
-# Price multiplier for converting decimal prices to contract units
-PRICE_MULTIPLIER = 1_000_000_000
+# On-disk instruments cache (instrument_hash/base_decimals are effectively static)
+INSTRUMENTS_CACHE_DIR = Path.home() / ".cache" / "grvt"
+INSTRUMENTS_CACHE_TTL_SECONDS = 3600
+
+# EIP-712 domain per chain ID, built once (eth-account does not mutate it)
+_DOMAIN_TEMPLATE_BY_CHAIN = {
+    cid: {"name": "GRVT Exchange", "version": "0", "chainId": cid} for cid in (325, 326, 327)
+}
+
+# Decimal places for converting decimal prices / builder fees to contract units
+PRICE_DECIMALS = 9
+BUILDER_FEE_DECIMALS = 4
 
 # EIP-712 Type definitions for order signing
 EIP712_ORDER_MESSAGE_TYPE = {
@@ -127,67 +191,298 @@ EIP712_ORDER_MESSAGE_TYPE = {
     ],
 }
 
+# JSON schema of one order as read from an order file (the object under "order"
+# in the wrapped format). Decimal fields may be strings or JSON numbers.
+_DECIMAL_SCHEMA = {"type": ["string", "number"]}
+ORDER_SCHEMA = {
+    "type": "object",
+    "required": ["sub_account_id", "legs", "signature"],
+    "properties": {
+        "sub_account_id": {"type": ["string", "integer"]},
+        "is_market": {"type": "boolean"},
+        "time_in_force": {"enum": [tif.value for tif in TimeInForce]},
+        "post_only": {"type": "boolean"},
+        "reduce_only": {"type": "boolean"},
+        "legs": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["instrument", "size", "limit_price", "is_buying_asset"],
+                "properties": {
+                    "instrument": {"type": "string"},
+                    "size": _DECIMAL_SCHEMA,
+                    "limit_price": _DECIMAL_SCHEMA,
+                    "is_buying_asset": {"type": "boolean"},
+                },
+            },
+        },
+        "signature": {
+            "type": "object",
+            "required": ["expiration", "nonce"],
+            "properties": {
+                "expiration": {"type": ["string", "integer"]},
+                "nonce": {"type": "integer", "minimum": 0, "maximum": 0xFFFFFFFF},
+            },
+        },
+        "metadata": {"type": "object"},
+        "builder": {"type": "string"},
+        "builder_fee": _DECIMAL_SCHEMA,
+    },
+}
+
+# Order schemas by Trading API version
+ORDER_SCHEMAS = {"v1": ORDER_SCHEMA}
+
+
+# ================================================================================
+# HTTP SESSION
+# ================================================================================
+
+# Headers every GRVT request shares; set once on the client instead of per call
+_DEFAULT_HEADERS = {
+    "Connection": "keep-alive",
+    "Content-Type": "application/json",
+    "User-Agent": "grvt-builder-examples/create-order",
+}
+
+
+def _new_session() -> requests.Session:
+    """
+    Create a pooled requests session.
+
+    Reusing one session keeps connections alive, so login, instruments
+    fetch and order submission skip a TCP/TLS handshake per request.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        ),
+    )
+    session.headers.update(_DEFAULT_HEADERS)
+    return session
+
+
+def _new_http2_client() -> Any:
+    """Create an httpx HTTP/2 client that multiplexes requests over one connection."""
+    # httpx is optional and only needed here, so it is imported on first use
+    try:
+        import httpx
+    except ImportError as e:
+        raise RuntimeError("--http2 requires httpx: pip install 'httpx[http2]'") from e
+    try:
+        return httpx.Client(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            headers=_DEFAULT_HEADERS,
+        )
+    except ImportError as e:
+        raise RuntimeError("--http2 requires the h2 package: pip install 'httpx[http2]'") from e
+
+
+# Default session for helpers called without an explicit one
+_SESSION = _new_session()
+atexit.register(_SESSION.close)
+
 
 # ================================================================================
 # UTILITY FUNCTIONS
 # ================================================================================
 
+# Locates the gravity cookie at a cookie boundary in a (possibly combined) Set-Cookie header
+_GRAVITY_RE = re.compile(r"(?:^|[;,\s])(gravity=[^;]*)", re.IGNORECASE)
+
+# Plain decimal strings (no exponent) that _scaled_int can shift without Decimal
+_PLAIN_DECIMAL_RE = re.compile(r"([+-]?)(\d*)(?:\.(\d*))?")
+
+
+class _NonceBuf:
+    """
+    Hands out uniform random 32-bit nonces from a buffered os.urandom read.
+
+    os.urandom is the same CSPRNG source secrets.randbelow uses, so nonces are
+    cryptographically equivalent; the buffer just amortizes one syscall over
+    `n` nonces.
+    """
+
+    def __init__(self, n: int = 256):
+        self._n = n
+        self._reset()
+
+    def _reset(self) -> None:
+        # Also called in forked children so they never replay the parent's buffer
+        self._lock = threading.Lock()
+        self._buf = os.urandom(self._n * 4)
+        self._i = 0
+
+    def next32(self) -> int:
+        """Return the next random integer in [0, 2**32)."""
+        with self._lock:
+            if self._i >= len(self._buf):
+                self._buf = os.urandom(self._n * 4)
+                self._i = 0
+            i = self._i
+            self._i = i + 4
+            return int.from_bytes(self._buf[i:i + 4], "big")
+
+
+_NONCE_BUF = _NonceBuf()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_NONCE_BUF._reset)
+
+
 def _ensure_0x(s: str) -> str:
     """Ensure a hex string has 0x prefix."""
     s = s.strip()
     return s if s.startswith("0x") else "0x" + s
 
 
+def _normalize_private_key(private_key: str) -> str:
+    """Lowercase a hex private key and strip any 0x prefix."""
+    key = private_key.strip().lower()
+    return key[2:] if key.startswith("0x") else key
+
+
+@functools.lru_cache(maxsize=8)
+def _account_for(pk_hex: str) -> Any:
+    """Derive (once) the signing account for a normalized private key."""
+    return Account.from_key(pk_hex)
+
+
+@functools.lru_cache(maxsize=8)
+def _coincurve_key_for(pk_hex: str) -> Any:
+    """Build (once) the libsecp256k1 key for a normalized private key."""
+    return _CoincurvePrivateKey(bytes.fromhex(pk_hex))
+
+
+def _scaled_int(s: Any, decimals: int) -> int:
+    """
+    Convert a decimal string to an integer scaled by 10**decimals.
+
+    Plain decimals ("-12.5") are converted by shifting the decimal point in
+    the string, truncating extra digits toward zero. Anything else, such as
+    exponent notation ("1e-3", or str() of a small JSON number), falls back
+    to int(Decimal(s) * 10**decimals).
+
+    Raises:
+        ValueError: If s is not a decimal number (including "", "-" and ".")
+    """
+    s = str(s).strip()
+    m = _PLAIN_DECIMAL_RE.fullmatch(s)
+    if m is None:
+        try:
+            return int(Decimal(s) * (10 ** decimals))
+        except InvalidOperation:
+            raise ValueError(f"Invalid decimal value: {s!r}") from None
+    sign, int_part, frac_part = m.group(1), m.group(2), m.group(3) or ""
+    if not int_part and not frac_part:
+        raise ValueError(f"Invalid decimal value: {s!r}")
+    value = int((int_part or "0") + frac_part[:decimals].ljust(decimals, "0"))
+    return -value if sign == "-" else value
+
+
 def _parse_gravity_cookie(set_cookie_header: Optional[str]) -> Optional[str]:
     """Parse gravity cookie from Set-Cookie header."""
     if not set_cookie_header:
         return None
-    idx = set_cookie_header.lower().find("gravity=")
-    if idx == -1:
-        return None
-    frag = set_cookie_header[idx:]
-    end = frag.find(";")
-    return frag if end == -1 else frag[:end]
-
-
-def _print_http(title: str, resp: requests.Response) -> None:
-    """Print HTTP request/response details."""
-    print(f"\n== {title} ==")
-    print(f"URL: {resp.request.method} {resp.request.url}")
-    print(f"Status: {resp.status_code}")
-    if resp.headers.get("x-grvt-account-id"):
-        print(f"X-Grvt-Account-Id: {resp.headers.get('x-grvt-account-id')}")
-    try:
-        data = resp.json()
-        print("Response:")
-        print(json.dumps(data, indent=2))
-    except Exception:
-        body = resp.text
-        print("Body:")
-        print(body[:2000] + ("..." if len(body) > 2000 else ""))
+    m = _GRAVITY_RE.search(set_cookie_header)
+    return m.group(1) if m else None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_pretty(obj: Any) -> str:
+    """Format JSON with 2-space indentation for display."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _http_post(
+    url: str,
+    payload: Any,
+    headers: Optional[Dict[str, str]] = None,
+    session: Optional[Any] = None
+) -> Any:
+    """
+    POST a JSON payload, serialized once to bytes (pre-encoded bytes are sent as-is).
+
+    `session` may be a requests.Session (default: the module-level one) or an
+    httpx.Client; both response types expose the attributes used here
+    (status_code, headers, content, text, request, raise_for_status).
+    """
+    session = session or _SESSION
+    body = payload if isinstance(payload, bytes) else _json_dumps(payload)
+    # httpx is only imported by _new_http2_client; if it is not loaded, session is not an httpx client
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(session, httpx.Client):
+        return session.post(url, content=body, headers=headers)
+    return session.post(url, data=body, headers=headers, timeout=30)
+
+
+# Serializes _print_http so dumps from concurrent create_order calls do not interleave
+_PRINT_LOCK = threading.Lock()
+
+
+def _print_http(title: str, resp: Any, parsed: Any = None) -> None:
+    """
+    Print HTTP request/response details.
+
+    Pass the already-parsed JSON body as `parsed` to avoid decoding it a
+    second time; otherwise the raw response text is printed.
+    """
+    with _PRINT_LOCK:
+        print(f"\n== {title} ==")
+        print(f"URL: {resp.request.method} {resp.request.url}")
+        print(f"Status: {resp.status_code}")
+        if resp.headers.get("x-grvt-account-id"):
+            print(f"X-Grvt-Account-Id: {resp.headers.get('x-grvt-account-id')}")
+        if parsed is not None:
+            print("Response:")
+            print(_json_pretty(parsed))
+        else:
+            body = resp.text
+            print("Body:")
+            print(body[:2000] + ("..." if len(body) > 2000 else ""))
 
 
 # ================================================================================
 # AUTHENTICATION FUNCTIONS
 # ================================================================================
 
-def login_with_api_key(env: GrvtEnv, api_key: str) -> Tuple[str, str]:
+def login_with_api_key(env: GrvtEnv, api_key: str, session: Optional[Any] = None) -> Tuple[str, str]:
     """
     Login with API key to get session cookie and account ID.
 
     Args:
         env: GRVT environment
         api_key: API key for authentication
+        session: HTTP session to reuse (default: module-level session)
 
     Returns:
         Tuple of (gravity_cookie, x_grvt_account_id)
     """
     edge_base = EDGE_API_ENDPOINTS[env]
     url = f"{edge_base}/auth/api_key/login"
-    headers = {"Content-Type": "application/json", "Cookie": "rm=true;"}
+    headers = {"Cookie": "rm=true;"}
 
-    print(f"\n🔐 Logging in with API key to {env.value} environment...")
-    resp = requests.post(url, headers=headers, json={"api_key": api_key}, timeout=30)
+    logger.info("\n🔐 Logging in with API key to %s environment...", env.value)
+    resp = _http_post(url, {"api_key": api_key}, headers, session)
 
     if resp.status_code != 200:
         _print_http("API Key Login Failed", resp)
@@ -201,8 +496,7 @@ def login_with_api_key(env: GrvtEnv, api_key: str) -> Tuple[str, str]:
     if not account_id:
         raise RuntimeError("Could not find x-grvt-account-id in response headers.")
 
-    print(f"✅ Login successful!")
-    print(f"   Account ID: {account_id}")
+    logger.info("✅ Login successful!\n   Account ID: %s", account_id)
     return gravity_cookie, account_id
 
 
@@ -210,36 +504,229 @@ def login_with_api_key(env: GrvtEnv, api_key: str) -> Tuple[str, str]:
 # INSTRUMENTS FUNCTIONS
 # ================================================================================
 
-def fetch_instruments_from_api(env: GrvtEnv) -> Dict[str, Dict[str, Any]]:
+def _instruments_cache_path(env: GrvtEnv) -> Path:
+    """Path of the on-disk instruments cache for an environment."""
+    return INSTRUMENTS_CACHE_DIR / f"instruments-{env.value}.json"
+
+
+def _read_instruments_cache(env: GrvtEnv, ttl: float) -> Optional[Dict[str, Tuple[str, int]]]:
+    """Return cached instruments if the cache file is younger than `ttl` seconds, else None."""
+    path = _instruments_cache_path(env)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        cached = _json_loads(path.read_bytes())
+        # JSON stores the (instrument_hash, base_decimals) tuples as lists
+        instruments = {name: (info[0], info[1]) for name, info in cached.items() if len(info) == 2}
+        # An empty cache would make every order fail with "Instrument not found"
+        return instruments or None
+    except (OSError, ValueError, AttributeError, TypeError, KeyError):
+        return None
+
+
+def _write_instruments_cache(env: GrvtEnv, instruments: Dict[str, Tuple[str, int]]) -> None:
+    """Atomically write instruments to the on-disk cache (best effort)."""
+    path = _instruments_cache_path(env)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_dumps(instruments))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # A read-only or missing home directory just means no cache.
+        pass
+
+
+# Instruments already loaded in this process, keyed by environment. Kept
+# apart from the session so one memo entry serves every client.
+_INSTRUMENTS_MEMO: Dict[GrvtEnv, Dict[str, Tuple[str, int]]] = {}
+
+
+def fetch_instruments_from_api(
+    env: GrvtEnv,
+    refresh: bool = False,
+    session: Optional[Any] = None,
+    cache_ttl: float = INSTRUMENTS_CACHE_TTL_SECONDS
+) -> Dict[str, Tuple[str, int]]:
     """
     Fetch instruments data from GRVT Market Data API.
 
+    Results are memoized per process and cached on disk for `cache_ttl`
+    seconds, so the returned dict is shared and must not be mutated.
+
     Args:
         env: GRVT environment
+        refresh: Ignore the in-process and on-disk caches and fetch from the API
+        session: HTTP session to reuse (default: module-level session)
+        cache_ttl: Maximum age in seconds of the on-disk cache (0 disables reading it)
 
     Returns:
-        Dictionary mapping instrument names to their metadata
+        Dictionary mapping instrument names to (instrument_hash, base_decimals)
     """
+    return _load_instruments(env, refresh, session, cache_ttl)[0]
+
+
+def _load_instruments(
+    env: GrvtEnv,
+    refresh: bool,
+    session: Optional[Any],
+    cache_ttl: float
+) -> Tuple[Dict[str, Tuple[str, int]], bool]:
+    """fetch_instruments_from_api, plus whether the result came from the in-process or on-disk cache."""
+    if not refresh:
+        memoized = _INSTRUMENTS_MEMO.get(env)
+        if memoized is not None:
+            return memoized, True
+        cached = _read_instruments_cache(env, cache_ttl)
+        if cached is not None:
+            logger.info("\n📦 Using cached instruments for %s (%d instruments)", env.value, len(cached))
+            _INSTRUMENTS_MEMO[env] = cached
+            return cached, True
+
     market_data_base = MARKET_DATA_API_ENDPOINTS[env]
     url = f"{market_data_base}/full/v1/all_instruments"
     payload = {"is_active": True}
 
-    print(f"\n🔄 Fetching instruments from {env.value} environment...")
-    response = requests.post(url, json=payload, timeout=30)
+    logger.info("\n🔄 Fetching instruments from %s environment...", env.value)
+    response = _http_post(url, payload, session=session)
     response.raise_for_status()
 
-    data = response.json()
-    instruments = {}
+    data = _json_loads(response.content)
+    instruments = {
+        i["instrument"]: (i["instrument_hash"], i["base_decimals"])
+        for i in data.get("result", [])
+    }
+
+    # Never cache an empty list (e.g. a 200 response without "result")
+    if instruments:
+        _write_instruments_cache(env, instruments)
+        _INSTRUMENTS_MEMO[env] = instruments
+    logger.info("✅ Fetched %d instruments", len(instruments))
+    return instruments, False
 
-    for instrument_data in data.get("result", []):
-        instrument_name = instrument_data["instrument"]
-        instruments[instrument_name] = {
-            "instrument_hash": instrument_data["instrument_hash"],
-            "base_decimals": instrument_data["base_decimals"]
-        }
 
-    print(f"✅ Fetched {len(instruments)} instruments")
-    return instruments
+# ================================================================================
+# EIP-712 HASHING
+# ================================================================================
+
+_EIP712_DOMAIN_TYPEHASH = keccak(text="EIP712Domain(string name,string version,uint256 chainId)")
+
+
+@functools.lru_cache(maxsize=4)
+def _domain_separator(env: GrvtEnv) -> bytes:
+    """Compute the EIP-712 domain separator for an environment's domain template (memoized)."""
+    domain = get_eip712_domain_data(env)
+    return keccak(encode(
+        ["bytes32", "bytes32", "bytes32", "uint256"],
+        [_EIP712_DOMAIN_TYPEHASH, keccak(text=domain["name"]), keccak(text=domain["version"]), domain["chainId"]],
+    ))
+
+
+if _crypto_keccak is not None:
+    def _keccak256(data: bytes) -> bytes:
+        """keccak256 of raw bytes (pycryptodome)."""
+        return _crypto_keccak.new(data=data, digest_bits=256).digest()
+else:  # pragma: no cover
+    _keccak256 = keccak
+
+
+@functools.lru_cache(maxsize=None)
+def _int_range(abi_type: str) -> Tuple[int, int, bool]:
+    """(min, max exclusive, signed) for an intN/uintN ABI type."""
+    if abi_type.startswith("uint"):
+        return 0, 1 << int(abi_type[4:]), False
+    bound = 1 << (int(abi_type[3:]) - 1)
+    return -bound, bound, True
+
+
+_FALSE_WORD = bytes(32)
+_TRUE_WORD = (1).to_bytes(32, "big")
+_ADDRESS_PAD = bytes(12)
+_HEX_INT_RE = re.compile(r"0[xX][0-9a-fA-F]+")
+
+
+def _pack_word(abi_type: str, value: Any) -> Optional[bytes]:
+    """
+    Pack one static order field as a 32-byte word.
+
+    Returns None for anything that is not already in canonical form (e.g. a
+    bool given as "true", a decimal string, an out-of-range int), so that
+    eth-account's hash_struct coerces or rejects it instead.
+    """
+    if abi_type == "bool":
+        if type(value) is bool:
+            return _TRUE_WORD if value else _FALSE_WORD
+        return None
+    if abi_type == "address":
+        if isinstance(value, str) and value[:2].lower() == "0x" and is_address(value):
+            return _ADDRESS_PAD + bytes.fromhex(value[2:])
+        return None
+    if isinstance(value, str) and _HEX_INT_RE.fullmatch(value):
+        value = int(value, 16)
+    if type(value) is int:
+        low, high, signed = _int_range(abi_type)
+        if low <= value < high:
+            return value.to_bytes(32, "big", signed=signed)
+    return None
+
+
+def _pack_order_struct(primary_type: str, data: Any) -> Optional[bytes]:
+    """
+    hashStruct of an order or order leg, packed word by word.
+
+    Only understands EIP712_ORDER_MESSAGE_TYPE. Returns None as soon as a
+    value needs coercion, and the caller then hashes the whole message with
+    eth-account.
+    """
+    if not isinstance(data, dict):
+        return None
+    fields = EIP712_ORDER_MESSAGE_TYPE[primary_type]
+    buf = bytearray(32 * (len(fields) + 1))
+    buf[:32] = _ORDER_TYPE_HASHES[primary_type]
+    for i, field in enumerate(fields, 1):
+        value = data.get(field["name"])
+        if field["type"].endswith("[]"):
+            if not isinstance(value, list):
+                return None
+            item_hashes = [_pack_order_struct(field["type"][:-2], item) for item in value]
+            if None in item_hashes:
+                return None
+            word = _keccak256(b"".join(item_hashes))
+        else:
+            word = _pack_word(field["type"], value)
+            if word is None:
+                return None
+        buf[32 * i:32 * i + 32] = word
+    return _keccak256(bytes(buf))
+
+
+# Type hashes of the order structs, computed once so signing never rebuilds encodeType
+_ORDER_TYPE_HASHES = (
+    {name: hash_type(name, EIP712_ORDER_MESSAGE_TYPE) for name in EIP712_ORDER_MESSAGE_TYPE}
+    if hash_type is not None else {}
+)
+
+
+def _order_signable_message(env: GrvtEnv, message_data: Dict[str, Any]) -> SignableMessage:
+    """
+    Build the EIP-712 signable message for an order.
+
+    Only the message struct is hashed per order; the domain separator is
+    precomputed. Messages the packer cannot encode exactly go through
+    eth-account's hash_struct, or its full encode_typed_data if the hashing
+    helpers are unavailable.
+    """
+    body = _pack_order_struct("OrderWithBuilderFee", message_data) if _ORDER_TYPE_HASHES else None
+    if body is None and hash_struct is not None:
+        body = hash_struct("OrderWithBuilderFee", EIP712_ORDER_MESSAGE_TYPE, message_data)
+    if body is None:
+        return encode_typed_data(get_eip712_domain_data(env), EIP712_ORDER_MESSAGE_TYPE, message_data)
+    return SignableMessage(version=b"\x01", header=_domain_separator(env), body=body)
 
 
 # ================================================================================
@@ -247,21 +734,17 @@ def fetch_instruments_from_api(env: GrvtEnv) -> Dict[str, Dict[str, Any]]:
 # ================================================================================
 
 def get_eip712_domain_data(env: GrvtEnv) -> Dict[str, Any]:
-    """Get EIP-712 domain data for the environment."""
-    return {
-        "name": "GRVT Exchange",
-        "version": "0",
-        "chainId": CHAIN_IDS[env],
-    }
+    """Get EIP-712 domain data for the environment (shared, do not mutate)."""
+    return _DOMAIN_TEMPLATE_BY_CHAIN[CHAIN_IDS[env]]
 
 
-def build_order_message_data(order_data: Dict[str, Any], instruments: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+def build_order_message_data(order_data: Dict[str, Any], instruments: Dict[str, Tuple[str, int]]) -> Dict[str, Any]:
     """
     Build EIP-712 order message data from order payload.
 
     Args:
         order_data: Order data containing legs, sub_account_id, etc.
-        instruments: Dictionary mapping instrument names to their metadata
+        instruments: Dictionary mapping instrument names to (instrument_hash, base_decimals)
 
     Returns:
         Dictionary containing the message data for signing
@@ -272,24 +755,20 @@ def build_order_message_data(order_data: Dict[str, Any], instruments: Dict[str,
     else:
         order = order_data
 
-    # Process order legs
-    legs = []
-    for leg in order["legs"]:
-        instrument_name = leg["instrument"]
-        if instrument_name not in instruments:
-            raise ValueError(f"Instrument '{instrument_name}' not found in instruments data")
-
-        instrument = instruments[instrument_name]
-        size_multiplier = 10 ** instrument["base_decimals"]
-
-        # Use Decimal for precision
-        size_int = int(Decimal(leg["size"]) * Decimal(size_multiplier))
-        price_int = int(Decimal(leg["limit_price"]) * Decimal(PRICE_MULTIPLIER))
+    # Resolve every leg's instrument up front with one dict lookup per leg
+    order_legs = order["legs"]
+    try:
+        leg_instruments = [instruments[leg["instrument"]] for leg in order_legs]
+    except KeyError as e:
+        raise ValueError(f"Instrument {e} not found in instruments data") from None
 
+    # Process order legs (exact decimal -> integer conversion without float rounding)
+    legs = []
+    for leg, (instrument_hash, base_decimals) in zip(order_legs, leg_instruments):
         legs.append({
-            "assetID": instrument["instrument_hash"],
-            "contractSize": size_int,
-            "limitPrice": price_int,
+            "assetID": instrument_hash,
+            "contractSize": _scaled_int(leg["size"], base_decimals),
+            "limitPrice": _scaled_int(leg["limit_price"], PRICE_DECIMALS),
             "isBuyingContract": leg["is_buying_asset"],
         })
 
@@ -299,7 +778,7 @@ def build_order_message_data(order_data: Dict[str, Any], instruments: Dict[str,
     sign_time_in_force = TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE[time_in_force]
 
     # Build message data
-    builder_fee_int = int(Decimal(order.get("builder_fee", "0.001")) * Decimal(10000))
+    builder_fee_int = _scaled_int(order.get("builder_fee", "0.001"), BUILDER_FEE_DECIMALS)
 
     return {
         "subAccountID": int(order["sub_account_id"]),
@@ -315,10 +794,23 @@ def build_order_message_data(order_data: Dict[str, Any], instruments: Dict[str,
     }
 
 
+@dataclass(frozen=True)
+class OrderSigner:
+    """A normalized private key and its signer address, derived once per run."""
+    private_key: str = field(repr=False)
+    address: str
+
+    @classmethod
+    def from_key(cls, private_key: str) -> "OrderSigner":
+        """Normalize a hex private key and derive its address."""
+        pk_hex = _normalize_private_key(private_key)
+        return cls(private_key=pk_hex, address=_account_for(pk_hex).address)
+
+
 def sign_order(
     order_data: Dict[str, Any],
-    instruments: Dict[str, Dict[str, Any]],
-    private_key: str,
+    instruments: Dict[str, Tuple[str, int]],
+    signer: Union[OrderSigner, str],
     env: GrvtEnv
 ) -> Dict[str, Any]:
     """
@@ -326,66 +818,102 @@ def sign_order(
 
     Args:
         order_data: Order data containing legs, signature info, etc.
-        instruments: Dictionary mapping instrument names to their metadata
-        private_key: Private key in hex format
+        instruments: Dictionary mapping instrument names to (instrument_hash, base_decimals)
+        signer: OrderSigner from OrderSigner.from_key(), or a private key in hex format
         env: GRVT environment
 
     Returns:
         Dictionary containing the complete signed order payload
     """
-    # Remove 0x prefix if present
-    if private_key.startswith("0x"):
-        private_key = private_key[2:]
-
     # Build EIP-712 message data
     message_data = build_order_message_data(order_data, instruments)
 
-    # Build EIP-712 domain data
-    domain_data = get_eip712_domain_data(env)
-
-    # Create signable message
-    signable_message = encode_typed_data(domain_data, EIP712_ORDER_MESSAGE_TYPE, message_data)
+    signable_message = _order_signable_message(env, message_data)
 
-    # Sign the message
-    account = Account.from_key(private_key)
-    signed_message = account.sign_message(signable_message)
+    # Sign the message; libsecp256k1 signs the final digest directly when available
+    if isinstance(signer, str):
+        signer = OrderSigner.from_key(signer)
+    if _CoincurvePrivateKey is not None:
+        digest = _keccak256(b"\x19" + signable_message.version + signable_message.header + signable_message.body)
+        sig = _coincurve_key_for(signer.private_key).sign_recoverable(digest, hasher=None)
+        r, s, v = int.from_bytes(sig[:32], "big"), int.from_bytes(sig[32:64], "big"), sig[64] + 27
+    else:
+        signed_message = _account_for(signer.private_key).sign_message(signable_message)
+        r, s, v = signed_message.r, signed_message.s, signed_message.v
 
-    # Extract signature components
-    signature = {
-        "r": "0x" + signed_message.r.to_bytes(32, byteorder="big").hex(),
-        "s": "0x" + signed_message.s.to_bytes(32, byteorder="big").hex(),
-        "v": signed_message.v,
-        "signer": account.address
+    # Build the signed payload in one literal (handle both wrapped and direct formats)
+    order = order_data["order"] if "order" in order_data else order_data
+    return {
+        "order": {
+            **order,
+            "signature": {
+                "r": f"0x{r:064x}",
+                "s": f"0x{s:064x}",
+                "v": v,
+                "expiration": order["signature"]["expiration"],
+                "nonce": order["signature"]["nonce"],
+                "signer": signer.address,
+            },
+        }
     }
 
-    # Create complete order payload
-    if "order" in order_data:
-        order = order_data["order"].copy()
-    else:
-        order = order_data.copy()
 
-    # Update the signature in the order data
-    order["signature"] = {
-        "r": signature["r"],
-        "s": signature["s"],
-        "v": signature["v"],
-        "expiration": order["signature"]["expiration"],
-        "nonce": order["signature"]["nonce"],
-        "signer": signature["signer"]
-    }
+def sign_orders_parallel(
+    order_list: List[Dict[str, Any]],
+    instruments: Dict[str, Tuple[str, int]],
+    signer: Union[OrderSigner, str],
+    env: GrvtEnv,
+    workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Sign many independent orders across a process pool.
 
-    return {"order": order}
+    Signing is pure CPU work with no shared state, so throughput scales with
+    cores. Each worker derives the signing account once and reuses it for its
+    chunk of orders.
+
+    On Linux, workers are forked and start immediately. On macOS (Python 3.8+)
+    and Windows the start method is "spawn": every worker re-imports this
+    module, so the pool is only worth it for large batches, and the calling
+    script must guard its entry point with `if __name__ == "__main__":`.
+
+    Args:
+        order_list: Order data to sign
+        instruments: Dictionary mapping instrument names to (instrument_hash, base_decimals) (must be picklable)
+        signer: OrderSigner from OrderSigner.from_key(), or a private key in hex format
+        env: GRVT environment
+        workers: Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        Signed order payloads, in the same order as order_list
+    """
+    if isinstance(signer, str):
+        signer = OrderSigner.from_key(signer)
+    sign = functools.partial(sign_order, instruments=instruments, signer=signer, env=env)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return list(executor.map(sign, order_list, chunksize=8))
 
 
 # ================================================================================
 # ORDER CREATION FUNCTIONS
 # ================================================================================
 
+def _create_order_request(env: GrvtEnv, gravity_cookie: str, account_id: str) -> Tuple[str, Dict[str, str]]:
+    """URL and per-request auth headers for a create_order call."""
+    url = f"{TRADING_API_ENDPOINTS[env]}/full/v1/create_order"
+    headers = {
+        "Cookie": gravity_cookie,
+        "X-Grvt-Account-Id": account_id,
+    }
+    return url, headers
+
+
 def create_order(
     env: GrvtEnv,
     gravity_cookie: str,
     account_id: str,
-    order_payload: Dict[str, Any]
+    order_payload: Union[Dict[str, Any], bytes],
+    session: Optional[Any] = None
 ) -> Dict[str, Any]:
     """
     Submit an order to the GRVT Trading API.
@@ -394,73 +922,225 @@ def create_order(
         env: GRVT environment
         gravity_cookie: Session cookie from login
         account_id: Account ID from login
-        order_payload: Complete signed order payload
+        order_payload: Complete signed order payload, as a dict or already JSON-encoded bytes
+        session: HTTP session to reuse (default: module-level session)
 
     Returns:
         API response with order details
     """
-    trades_base = TRADING_API_ENDPOINTS[env]
-    url = f"{trades_base}/full/v1/create_order"
+    url, headers = _create_order_request(env, gravity_cookie, account_id)
 
-    headers = {
-        "Content-Type": "application/json",
-        "Cookie": gravity_cookie,
-        "X-Grvt-Account-Id": account_id,
-    }
-
-    print(f"\n📤 Submitting order to {env.value} Trading API...")
-    print(f"   Endpoint: {url}")
-    print(json.dumps(order_payload, indent=2))
-    print(headers)
-    resp = requests.post(url, headers=headers, json=order_payload, timeout=30)
+    logger.info("\n📤 Submitting order to %s Trading API...\n   Endpoint: %s", env.value, url)
+    if logger.isEnabledFor(logging.DEBUG):
+        # The signature and session cookie are deliberately left out of the log.
+        payload = _json_loads(order_payload) if isinstance(order_payload, bytes) else order_payload
+        order = payload.get("order", payload)
+        logger.debug("Order payload:\n%s", _json_pretty({**order, "signature": "<redacted>"}))
+    resp = _http_post(url, order_payload, headers, session)
 
     if resp.status_code != 200:
         _print_http("Create Order Failed", resp)
         raise RuntimeError(f"Order creation failed with status {resp.status_code}")
 
-    print(f"✅ Order submitted successfully!")
-    return resp.json()
+    logger.info("✅ Order submitted successfully!")
+    return _json_loads(resp.content)
+
+
+async def create_order_async(
+    session: "aiohttp.ClientSession",
+    env: GrvtEnv,
+    gravity_cookie: str,
+    account_id: str,
+    order_payload: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Submit an order to the GRVT Trading API over an aiohttp session.
+
+    Args:
+        session: Open aiohttp client session
+        env: GRVT environment
+        gravity_cookie: Session cookie from login
+        account_id: Account ID from login
+        order_payload: Complete signed order payload
+
+    Returns:
+        API response with order details
+    """
+    url, headers = _create_order_request(env, gravity_cookie, account_id)
+    # The caller's session may not carry _DEFAULT_HEADERS, so set the body type here
+    headers["Content-Type"] = "application/json"
+    async with session.post(url, data=_json_dumps(order_payload), headers=headers) as resp:
+        if resp.status != 200:
+            body = await resp.text()
+            raise RuntimeError(f"Order creation failed with status {resp.status}: {body[:2000]}")
+        return _json_loads(await resp.read())
+
+
+def submit_orders_batch(
+    env: GrvtEnv,
+    gravity_cookie: str,
+    account_id: str,
+    order_payloads: List[Dict[str, Any]],
+    concurrency: int = 10
+) -> List[Any]:
+    """
+    Submit many signed orders concurrently over one pooled aiohttp session.
+
+    Requests are pipelined over at most `concurrency` keep-alive connections,
+    so N orders take roughly one round-trip plus serialization time instead
+    of N round-trips.
+
+    Args:
+        env: GRVT environment
+        gravity_cookie: Session cookie from login
+        account_id: Account ID from login
+        order_payloads: Complete signed order payloads
+        concurrency: Maximum number of simultaneous connections
+
+    Returns:
+        One entry per payload, in input order: the API response, or the
+        exception raised while submitting that order
+    """
+    # aiohttp is optional and only needed here, so it is imported on first use
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise RuntimeError("submit_orders_batch requires aiohttp: pip install aiohttp") from e
+
+    async def _submit_all() -> List[Any]:
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(
+                *(create_order_async(session, env, gravity_cookie, account_id, p) for p in order_payloads),
+                return_exceptions=True,
+            )
+
+    return asyncio.run(_submit_all())
+
+
+def submit_orders_threaded(
+    env: GrvtEnv,
+    gravity_cookie: str,
+    account_id: str,
+    order_payloads: List[Union[Dict[str, Any], bytes]],
+    session: Optional[Any] = None,
+    max_workers: int = 8
+) -> List[Any]:
+    """
+    Submit many signed orders concurrently over one pooled HTTP client.
+
+    The Trading API has no batch create endpoint, so orders are sent as
+    individual create_order requests from a small thread pool. All threads
+    share the client's keep-alive connections, so no extra TLS handshakes
+    are paid beyond the first few.
+
+    Args:
+        env: GRVT environment
+        gravity_cookie: Session cookie from login
+        account_id: Account ID from login
+        order_payloads: Complete signed order payloads, as dicts or JSON-encoded bytes
+        session: HTTP session to reuse (default: module-level session)
+        max_workers: Maximum number of requests in flight
+
+    Returns:
+        One entry per payload, in input order: the API response, or the
+        exception raised while submitting that order
+    """
+    def _submit(payload: Union[Dict[str, Any], bytes]) -> Any:
+        try:
+            return create_order(env, gravity_cookie, account_id, payload, session)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_submit, order_payloads))
+
+
+def _print_batch_results(signed_orders: List[Dict[str, Any]], results: List[Any]) -> None:
+    """Print one row per submitted order: client order ID, status and order ID or error."""
+    print(f"{'#':>4}  {'CLIENT ORDER ID':<20}  {'STATUS':<6}  ORDER ID / ERROR")
+    for i, (signed, result) in enumerate(zip(signed_orders, results), 1):
+        # client_order_id may be a number or JSON null, so coerce it before padding
+        client_order_id = str((signed["order"].get("metadata") or {}).get("client_order_id") or "")
+        if isinstance(result, Exception):
+            status, detail = "FAILED", str(result)
+        else:
+            inner = result.get("result") if isinstance(result, dict) else None
+            order_id = inner.get("order_id") if isinstance(inner, dict) else None
+            status, detail = "OK", str(order_id or "")
+        print(f"{i:>4}  {client_order_id:<20}  {status:<6}  {detail}")
 
 
 # ================================================================================
 # FILE I/O FUNCTIONS
 # ================================================================================
 
-def load_json_file(file_path: str) -> Dict[str, Any]:
+def load_json_file(file_path: str) -> Any:
     """Load JSON data from a file."""
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in file {file_path}: {e}")
 
 
-def update_order_signature_fields(order_data: Dict[str, Any], expiration_hours: int = 24) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=None)
+def _order_validator(api_version: str = "v1") -> Any:
+    """Compile (once) the fastjsonschema validator for an API version's order schema."""
+    return fastjsonschema.compile(ORDER_SCHEMAS[api_version])
+
+
+def validate_order_data(order_data: Any, api_version: str = "v1") -> None:
+    """
+    Check an order's structure before signing.
+
+    A no-op when fastjsonschema is not installed; signing then fails later
+    with a KeyError or ValueError on malformed orders instead.
+
+    Args:
+        order_data: Order data in wrapped or direct format
+        api_version: Trading API version whose order schema applies
+
+    Raises:
+        ValueError: If the order does not match the schema
+    """
+    if fastjsonschema is None:
+        return
+    order = order_data["order"] if isinstance(order_data, dict) and "order" in order_data else order_data
+    try:
+        _order_validator(api_version)(order)
+    except fastjsonschema.JsonSchemaValueException as e:
+        raise ValueError(f"Invalid order data: {e.message}") from None
+
+
+def update_order_signature_fields(
+    order_data: Dict[str, Any],
+    expiration_hours: int = 24,
+    expiration_ns: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Update order signature fields with fresh expiration and nonce.
 
     Args:
         order_data: Order data to update
         expiration_hours: Hours until expiration (default 24)
+        expiration_ns: Precomputed expiration in nanoseconds; lets a batch of
+            orders share one timestamp (default: now + expiration_hours)
 
     Returns:
         Updated order data
     """
     # Generate new expiration (in nanoseconds)
-    expiration_ns = int((time.time() + expiration_hours * 3600) * 1_000_000_000)
+    if expiration_ns is None:
+        expiration_ns = time.time_ns() + expiration_hours * 3_600_000_000_000
 
-    # Generate new nonce
-    nonce = secrets.randbelow(2**32)
-
-    # Update signature fields
-    if "order" in order_data:
-        order_data["order"]["signature"]["expiration"] = str(expiration_ns)
-        order_data["order"]["signature"]["nonce"] = nonce
-    else:
-        order_data["signature"]["expiration"] = str(expiration_ns)
-        order_data["signature"]["nonce"] = nonce
+    # Update signature fields (handle both wrapped and direct formats)
+    signature = order_data["order"]["signature"] if "order" in order_data else order_data["signature"]
+    signature["expiration"] = str(expiration_ns)
+    signature["nonce"] = _NONCE_BUF.next32()
 
     return order_data
 
@@ -492,7 +1172,7 @@ def main() -> int:
     parser.add_argument(
         "--order-file",
         default="create_order_data.json",
-        help="Path to order data JSON file (default: create_order_data.json)"
+        help="Path to order data JSON file, holding one order or a list of orders (default: create_order_data.json)"
     )
     parser.add_argument(
         "--update-expiration",
@@ -505,49 +1185,130 @@ def main() -> int:
         default=24,
         help="Hours until order expiration (default: 24)"
     )
+    parser.add_argument(
+        "--refresh-instruments",
+        action="store_true",
+        help="Ignore the cached instruments list and fetch it from the API"
+    )
+    parser.add_argument(
+        "--instruments-cache-ttl",
+        type=float,
+        default=INSTRUMENTS_CACHE_TTL_SECONDS,
+        help=f"Seconds to reuse the cached instruments list (default: {INSTRUMENTS_CACHE_TTL_SECONDS})"
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Send requests over HTTP/2 with httpx instead of requests"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print progress messages for each step"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Print progress messages, log request payloads (signatures redacted) and show tracebacks on error"
+    )
 
     args = parser.parse_args()
 
+    # Progress messages go to stderr through logging; only results are printed to stdout
+    logging.basicConfig(format="%(message)s")
+    if args.debug:
+        logger.setLevel(logging.DEBUG)
+    elif args.verbose:
+        logger.setLevel(logging.INFO)
+
     try:
         # Parse environment
         env = GrvtEnv(args.env)
 
-        print("=" * 70)
-        print("GRVT Order Creation with API Key Authentication")
-        print("=" * 70)
-        print(f"Environment: {env.value}")
-
-        # Step 1: Login with API key
-        gravity_cookie, account_id = login_with_api_key(env, args.api_key)
-
-        # Step 2: Fetch instruments
-        instruments = fetch_instruments_from_api(env)
-
-        # Step 3: Load order data
-        print(f"\n📂 Loading order data from {args.order_file}...")
-        order_data = load_json_file(args.order_file)
-        print(f"✅ Order data loaded")
-
-        # Step 4: Update signature fields if requested
-        if args.update_expiration:
-            print(f"\n🔄 Updating order expiration and nonce...")
-            order_data = update_order_signature_fields(order_data, args.expiration_hours)
-            print(f"✅ Updated expiration and nonce")
-
-        # Step 5: Sign the order
-        print(f"\n🔐 Signing order with EIP-712 signature...")
-        signed_order = sign_order(order_data, instruments, args.private_key, env)
-        print(f"✅ Order signed")
-        print(f"   Signer: {signed_order['order']['signature']['signer']}")
-
-        # Step 6: Submit the order
-        result = create_order(env, gravity_cookie, account_id, signed_order)
-
-        # Step 7: Display results
-        print("\n" + "=" * 70)
-        print("ORDER RESULT")
-        print("=" * 70)
-        print(json.dumps(result, indent=2))
+        logger.info("\n".join([
+            "=" * 70,
+            "GRVT Order Creation with API Key Authentication",
+            "=" * 70,
+            f"Environment: {env.value}",
+        ]))
+
+        # Derive the signer once; every order in the run reuses it
+        signer = OrderSigner.from_key(args.private_key)
+
+        # One pooled client for every request in this run
+        session = _new_http2_client() if args.http2 else _new_session()
+        with closing(session):
+            # Steps 1 and 2 are independent, so login and the instruments
+            # fetch run concurrently over the same pooled client
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Step 1: Login with API key
+                login_future = executor.submit(login_with_api_key, env, args.api_key, session)
+
+                # Step 2: Fetch instruments
+                instruments_future = executor.submit(
+                    _load_instruments,
+                    env,
+                    args.refresh_instruments,
+                    session,
+                    args.instruments_cache_ttl,
+                )
+
+                gravity_cookie, account_id = login_future.result()
+                instruments, instruments_cached = instruments_future.result()
+
+            # Step 3: Load order data (a single order or a list of orders)
+            logger.info("\n📂 Loading order data from %s...", args.order_file)
+            order_data = load_json_file(args.order_file)
+            is_batch = isinstance(order_data, list)
+            orders = order_data if is_batch else [order_data]
+            logger.info("✅ Order data loaded (%d order%s)", len(orders), "s" if len(orders) != 1 else "")
+
+            # Step 4: Update signature fields if requested
+            if args.update_expiration:
+                logger.info("\n🔄 Updating order expiration and nonce...")
+                expiration_ns = time.time_ns() + args.expiration_hours * 3_600_000_000_000
+                orders = [update_order_signature_fields(o, expiration_ns=expiration_ns) for o in orders]
+                logger.info("✅ Updated expiration and nonce")
+
+            # Validate after Step 4, which fills in signature.expiration/nonce for templates
+            for i, order in enumerate(orders, 1):
+                try:
+                    validate_order_data(order)
+                except ValueError as e:
+                    raise ValueError(f"{args.order_file}, order {i}: {e}") from None
+
+            # A cached instruments list may predate a newly listed instrument; refetch once on a miss
+            wanted = {leg["instrument"] for o in orders for leg in o.get("order", o)["legs"]}
+            if instruments_cached and not wanted <= instruments.keys():
+                instruments = fetch_instruments_from_api(
+                    env,
+                    refresh=True,
+                    session=session,
+                    cache_ttl=args.instruments_cache_ttl,
+                )
+
+            # Step 5: Sign the orders
+            logger.info("\n🔐 Signing order with EIP-712 signature...")
+            signed_orders = [sign_order(o, instruments, signer, env) for o in orders]
+            logger.info("✅ Order signed\n   Signer: %s", signer.address)
+
+            # Step 6: Submit the orders, each serialized exactly once
+            bodies = [_json_dumps(o) for o in signed_orders]
+            if is_batch:
+                results = submit_orders_threaded(env, gravity_cookie, account_id, bodies, session)
+            else:
+                result = create_order(env, gravity_cookie, account_id, bodies[0], session)
+
+            # Step 7: Display results
+            print("\n" + "=" * 70)
+            print("ORDER RESULT")
+            print("=" * 70)
+            if is_batch:
+                _print_batch_results(signed_orders, results)
+                if any(isinstance(r, Exception) for r in results):
+                    return 1
+            else:
+                print(_json_pretty(result))
 
         return 0
 
@@ -555,9 +1316,9 @@ def main() -> int:
         print("\n\n⚠️  Operation cancelled by user.")
         return 1
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        if args.debug:
+            traceback.print_exc()
         return 1
 
 